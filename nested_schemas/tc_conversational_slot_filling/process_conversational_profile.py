@@ -23,6 +23,7 @@ Output: Session state with completeness tracking and smart prompts
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import time
 import uuid
 
 
@@ -162,7 +163,10 @@ def start_profile_session(data: dict) -> dict:
         "profile": profile,
         "conversation_turn": 1,
         "created_at": datetime.utcnow().isoformat() + "Z",
-        "updated_at": datetime.utcnow().isoformat() + "Z"
+        "updated_at": datetime.utcnow().isoformat() + "Z",
+        # Epoch seconds kept alongside the ISO string so finalize can compute
+        # elapsed time by subtraction instead of re-parsing the ISO strings
+        "_created_ts": time.time()
     }
 
     SESSIONS[session_id] = session
@@ -270,12 +274,7 @@ def finalize_profile_session(session_id: str) -> dict:
     address_formatted = ", ".join([p for p in address_parts if p])
 
     # Calculate time to complete
-    created = datetime.fromisoformat(
-        session["created_at"].replace("Z", "+00:00"))
-    updated = datetime.fromisoformat(
-        session["updated_at"].replace("Z", "+00:00"))
-    time_diff = updated - created
-    minutes = int(time_diff.total_seconds() / 60)
+    minutes = int((time.time() - session["_created_ts"]) / 60)
 
     # Count fields collected
     fields_collected = 0
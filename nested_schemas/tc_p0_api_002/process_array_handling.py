@@ -27,10 +27,57 @@ Input: Wrapped arrays of inventory items or batch orders
 Output: Processed results with status and details
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from functools import partial
+from operator import itemgetter
 from typing import Dict, Any, List
 import logging
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Batches below this size stay on the scalar path: building the NumPy
+# vectors costs more than the vectorized multiply saves for small N
+_VECTORIZE_MIN_ITEMS = 64
+
+# Order batches above this size fan out across a thread pool; below it
+# the pool setup costs more than the per-order work
+_PARALLEL_MIN_ORDERS = 256
+
+# Inventory ids for the first 256 positions, precomputed once; larger
+# batches fall back to C-level %-formatting (no intermediate str/zfill)
+_INV_ID_CACHE = tuple("INV-2024-%03d" % (i + 1) for i in range(256))
+
+# Bulk field extractors: one C-level call pulls every field of a
+# fully-populated item/spec dict; sparse dicts fall back to per-key .get
+_ITEM_FIELDS = itemgetter("name", "sku", "quantity", "price",
+                          "category", "specifications")
+_SPEC_FIELDS = itemgetter("brand", "model", "warranty")
+
+# Prototype for per-item result rows: .copy() clones the presized table in
+# one C call and the loop only overwrites the variable slots ("status" is
+# constant and comes along for free)
+_ITEM_PROTO = {
+    "name": None,
+    "sku": None,
+    "status": "added",
+    "inventory_id": None,
+    "quantity": None,
+    "unit_price": None,
+    "total_value": None,
+    "category": None,
+    "specifications": None,
+}
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,7 +87,92 @@ app = Flask(__name__)
 CORS(app)
 
 
-def process_inventory_items(request_data: dict) -> dict:
+def _parse_json_request():
+    """Parse the request body, preferring orjson's C decoder.
+
+    Returns None for an empty or invalid body, which the handlers below
+    map to their INVALID_JSON error response.
+    """
+    if orjson is None:
+        return request.get_json(silent=True)
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+
+
+# Static validation-error payloads; the bytes variants are serialized once
+# at import so the failure branches skip dict construction and encoding
+_STATIC_ERRORS = {
+    "INVALID_JSON": {
+        "error": "Invalid request",
+        "code": "INVALID_JSON",
+        "details": {"message": "Request body must be valid JSON"}
+    },
+    "MISSING_ITEMS": {
+        "error": "Missing required field",
+        "code": "MISSING_ITEMS",
+        "details": {"message": "Request must contain 'items' array"}
+    },
+    "INVALID_ITEMS_TYPE": {
+        "error": "Invalid data type",
+        "code": "INVALID_ITEMS_TYPE",
+        "details": {"message": "'items' must be an array"}
+    },
+    "MISSING_ORDERS": {
+        "error": "Missing required field",
+        "code": "MISSING_ORDERS",
+        "details": {"message": "Request must contain 'orders' array"}
+    },
+    "INVALID_ORDERS_TYPE": {
+        "error": "Invalid data type",
+        "code": "INVALID_ORDERS_TYPE",
+        "details": {"message": "'orders' must be an array"}
+    },
+    "INVALID_TYPE": {
+        "error": "Invalid data type",
+        "code": "INVALID_TYPE",
+        "details": {"message": "Request body must be an array"}
+    },
+}
+_STATIC_ERROR_BYTES = (
+    {code: orjson.dumps(payload) for code, payload in _STATIC_ERRORS.items()}
+    if orjson is not None else None
+)
+
+# Constant health-check payload, encoded once at import
+_HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "service": "Array Handling API",
+    "test_case": "TC-P0-API-002",
+    "version": "1.0.0"
+}
+_HEALTH_BYTES = orjson.dumps(_HEALTH_PAYLOAD) if orjson is not None else None
+
+
+def _error_response(code, status=400):
+    """Return the prebuilt response for a static validation error."""
+    if _STATIC_ERROR_BYTES is not None:
+        return app.response_class(_STATIC_ERROR_BYTES[code], status=status,
+                                  mimetype='application/json')
+    return _json_response(_STATIC_ERRORS[code], status)
+
+
+def _json_response(obj, status=200):
+    """Serialize a response dict straight to JSON bytes.
+
+    Uses orjson when installed, skipping the jsonify round-trip through
+    the stdlib encoder; falls back to jsonify otherwise.
+    """
+    if orjson is not None:
+        return app.response_class(orjson.dumps(obj), status=status,
+                                  mimetype='application/json')
+    response = jsonify(obj)
+    response.status_code = status
+    return response
+
+
+def process_inventory_items(request_data: dict, summary_only: bool = False) -> dict:
     """Process inventory items with wrapped array structure.
 
     This function demonstrates the CORRECT way to handle arrays:
@@ -50,6 +182,8 @@ def process_inventory_items(request_data: dict) -> dict:
 
     Args:
         request_data (dict): Request with wrapped items array
+        summary_only (bool): Skip building processed_items and return only
+            totals and the summary block
 
     Returns:
         dict: Processing result with status and processed items
@@ -68,65 +202,110 @@ def process_inventory_items(request_data: dict) -> dict:
 
         processed_items = []
         total_value = 0.0
+        # Summary accumulators, folded into the main loop so the items
+        # list is walked once instead of three times
+        total_quantity = 0
+        categories_set = set()
+
+        # For large batches, compute every item value in one vectorized
+        # multiply/reduce instead of per-item Python arithmetic
+        values = None
+        if np is not None and len(items) >= _VECTORIZE_MIN_ITEMS:
+            count = len(items)
+            qs = np.fromiter((it.get("quantity", 0) for it in items),
+                             dtype=np.float64, count=count)
+            ps = np.fromiter((it.get("price", 0.0) for it in items),
+                             dtype=np.float64, count=count)
+            values = qs * ps
+            total_value = float(values.sum())
+
+        # Bind hot attributes once outside the loop: LOAD_FAST beats a
+        # method/global lookup per iteration
+        append = processed_items.append
+        add_category = categories_set.add
+        inv_ids = _INV_ID_CACHE
 
         for idx, item in enumerate(items):
-            # Extract item details
-            name = item.get("name", "Unknown")
-            sku = item.get("sku", "")
-            quantity = item.get("quantity", 0)
-            price = item.get("price", 0.0)
-            category = item.get("category", "Uncategorized")
+            # Extract item details: one tuple-extract for complete items,
+            # per-key .get defaults for sparse ones
+            try:
+                name, sku, quantity, price, category, specs = _ITEM_FIELDS(
+                    item)
+            except KeyError:
+                name = item.get("name", "Unknown")
+                sku = item.get("sku", "")
+                quantity = item.get("quantity", 0)
+                price = item.get("price", 0.0)
+                category = item.get("category", "Uncategorized")
+                specs = item.get("specifications", {})
+            total_quantity += quantity
+            add_category(category)
+
+            # Calculate item value (precomputed on the vectorized path)
+            if values is None:
+                item_value = quantity * price
+                total_value += item_value
+            else:
+                item_value = float(values[idx])
+
+            # Aggregate-only callers skip all per-item dict construction
+            if summary_only:
+                continue
 
             # Extract nested specifications
-            specs = item.get("specifications", {})
-            brand = specs.get("brand", "N/A")
-            model = specs.get("model", "N/A")
-            warranty = specs.get("warranty", "N/A")
-
-            # Calculate item value
-            item_value = quantity * price
-            total_value += item_value
-
-            # Create processed item
-            processed_item = {
-                "name": name,
-                "sku": sku,
-                "status": "added",
-                "inventory_id": f"INV-2024-{str(idx + 1).zfill(3)}",
-                "quantity": quantity,
-                "unit_price": price,
-                "total_value": item_value,
-                "category": category,
-                "specifications": {
-                    "brand": brand,
-                    "model": model,
-                    "warranty": warranty
-                }
+            try:
+                brand, model, warranty = _SPEC_FIELDS(specs)
+            except KeyError:
+                brand = specs.get("brand", "N/A")
+                model = specs.get("model", "N/A")
+                warranty = specs.get("warranty", "N/A")
+
+            # Create processed item from the prototype
+            processed_item = _ITEM_PROTO.copy()
+            processed_item["name"] = name
+            processed_item["sku"] = sku
+            processed_item["inventory_id"] = (
+                inv_ids[idx] if idx < 256 else "INV-2024-%03d" % (idx + 1))
+            processed_item["quantity"] = quantity
+            processed_item["unit_price"] = price
+            processed_item["total_value"] = item_value
+            processed_item["category"] = category
+            processed_item["specifications"] = {
+                "brand": brand,
+                "model": model,
+                "warranty": warranty
             }
 
-            processed_items.append(processed_item)
+            append(processed_item)
 
-            logger.info(
-                f"Processed item: {name} (SKU: {sku}) - {quantity} units @ ${price}")
+            # Lazy %-formatting, and DEBUG so the hot loop logs nothing
+            # at the default INFO level
+            logger.debug("Processed item: %s (SKU: %s) - %s units @ $%s",
+                         name, sku, quantity, price)
+
+        # Both paths round only the aggregate, never per-item values, so
+        # scalar and vectorized batches price identically
+        total_value = round(total_value, 2)
 
         result = {
             "status": "success",
             "message": f"Successfully processed {len(items)} inventory items",
-            "processed_items": processed_items,
-            "total_value": round(total_value, 2),
-            "summary": {
-                "total_items": len(items),
-                "total_quantity": sum(item.get("quantity", 0) for item in items),
-                "categories": list(set(item.get("category", "Uncategorized") for item in items))
-            }
+        }
+        if not summary_only:
+            result["processed_items"] = processed_items
+        result["total_value"] = total_value
+        result["summary"] = {
+            "total_items": len(items),
+            "total_quantity": total_quantity,
+            "categories": list(categories_set)
         }
 
-        logger.info(
-            f"Inventory processing complete: {len(items)} items, total value: ${total_value:.2f}")
+        logger.info("Inventory processing complete: %d items, total value: $%.2f",
+                    len(items), total_value)
         return result
 
     except Exception as e:
-        logger.error(f"Error processing inventory items: {str(e)}")
+        logger.error("Error processing inventory items: %s", e)
         return {
             "status": "failed",
             "message": f"Error processing items: {str(e)}",
@@ -135,7 +314,59 @@ def process_inventory_items(request_data: dict) -> dict:
         }
 
 
-def process_batch_orders(request_data: dict) -> dict:
+def _process_one_order(order: dict, summary_only: bool = False) -> tuple:
+    """Total and shape a single order (worker for the batch processor).
+
+    Args:
+        order (dict): One order with order_id, customer_name, and items
+        summary_only (bool): Skip building the processed-order dict
+
+    Returns:
+        tuple: (processed_order dict or None, unrounded order total)
+    """
+    order_id = order.get("order_id", "Unknown")
+    customer_name = order.get("customer_name", "Unknown Customer")
+
+    # Extract nested wrapped items array
+    items = order.get("items", [])
+
+    order_total = 0.0
+    processed_items = []
+
+    for item in items:
+        product_name = item.get("product_name", "Unknown Product")
+        quantity = item.get("quantity", 1)
+        unit_price = item.get("unit_price", 0.0)
+        item_total = quantity * unit_price
+        order_total += item_total
+
+        if not summary_only:
+            processed_items.append({
+                "product_name": product_name,
+                "quantity": quantity,
+                "unit_price": unit_price,
+                "item_total": item_total
+            })
+
+    # Aggregate-only callers skip all per-order dict construction
+    if summary_only:
+        return None, order_total
+    processed_order = {
+        "order_id": order_id,
+        "customer_name": customer_name,
+        "status": "processed",
+        "items_count": len(items),
+        "items": processed_items,
+        "total_amount": round(order_total, 2)
+    }
+
+    logger.debug("Processed order: %s for %s - $%.2f",
+                 order_id, customer_name, order_total)
+
+    return processed_order, order_total
+
+
+def process_batch_orders(request_data: dict, summary_only: bool = False) -> dict:
     """Process batch orders with nested wrapped arrays.
 
     This function demonstrates nested wrapped arrays:
@@ -145,6 +376,8 @@ def process_batch_orders(request_data: dict) -> dict:
 
     Args:
         request_data (dict): Request with wrapped orders array
+        summary_only (bool): Skip building processed_orders and return only
+            the summary block
 
     Returns:
         dict: Processing result with order statuses
@@ -163,64 +396,38 @@ def process_batch_orders(request_data: dict) -> dict:
         processed_orders = []
         total_revenue = 0.0
 
-        for order in orders:
-            order_id = order.get("order_id", "Unknown")
-            customer_name = order.get("customer_name", "Unknown Customer")
-
-            # Extract nested wrapped items array
-            items = order.get("items", [])
-
-            order_total = 0.0
-            processed_items = []
-
-            for item in items:
-                product_name = item.get("product_name", "Unknown Product")
-                quantity = item.get("quantity", 1)
-                unit_price = item.get("unit_price", 0.0)
-                item_total = quantity * unit_price
-
-                processed_items.append({
-                    "product_name": product_name,
-                    "quantity": quantity,
-                    "unit_price": unit_price,
-                    "item_total": item_total
-                })
-
-                order_total += item_total
+        # Orders are independent: large batches fan out across a thread
+        # pool, small ones run the same worker inline
+        worker = partial(_process_one_order, summary_only=summary_only)
+        if len(orders) > _PARALLEL_MIN_ORDERS:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                shaped = list(executor.map(worker, orders))
+        else:
+            shaped = map(worker, orders)
 
+        for processed_order, order_total in shaped:
             total_revenue += order_total
-
-            processed_order = {
-                "order_id": order_id,
-                "customer_name": customer_name,
-                "status": "processed",
-                "items_count": len(items),
-                "items": processed_items,
-                "total_amount": round(order_total, 2)
-            }
-
-            processed_orders.append(processed_order)
-
-            logger.info(
-                f"Processed order: {order_id} for {customer_name} - ${order_total:.2f}")
+            if processed_order is not None:
+                processed_orders.append(processed_order)
 
         result = {
             "status": "success",
             "message": f"Successfully processed {len(orders)} batch orders",
-            "processed_orders": processed_orders,
-            "summary": {
-                "total_orders": len(orders),
-                "total_revenue": round(total_revenue, 2),
-                "average_order_value": round(total_revenue / len(orders), 2) if orders else 0
-            }
+        }
+        if not summary_only:
+            result["processed_orders"] = processed_orders
+        result["summary"] = {
+            "total_orders": len(orders),
+            "total_revenue": round(total_revenue, 2),
+            "average_order_value": round(total_revenue / len(orders), 2) if orders else 0
         }
 
-        logger.info(
-            f"Batch processing complete: {len(orders)} orders, total revenue: ${total_revenue:.2f}")
+        logger.info("Batch processing complete: %d orders, total revenue: $%.2f",
+                    len(orders), total_revenue)
         return result
 
     except Exception as e:
-        logger.error(f"Error processing batch orders: {str(e)}")
+        logger.error("Error processing batch orders: %s", e)
         return {
             "status": "failed",
             "message": f"Error processing orders: {str(e)}",
@@ -232,177 +439,147 @@ def process_batch_orders(request_data: dict) -> dict:
 def api_process_inventory_items():
     """API endpoint for processing inventory items (wrapped array)."""
     try:
-        request_data = request.get_json()
+        request_data = _parse_json_request()
 
         if not request_data:
-            return jsonify({
-                "error": "Invalid request",
-                "code": "INVALID_JSON",
-                "details": {"message": "Request body must be valid JSON"}
-            }), 400
+            return _error_response("INVALID_JSON")
 
         # Validate wrapped array structure
         if "items" not in request_data:
-            return jsonify({
-                "error": "Missing required field",
-                "code": "MISSING_ITEMS",
-                "details": {"message": "Request must contain 'items' array"}
-            }), 400
+            return _error_response("MISSING_ITEMS")
 
         if not isinstance(request_data["items"], list):
-            return jsonify({
-                "error": "Invalid data type",
-                "code": "INVALID_ITEMS_TYPE",
-                "details": {"message": "'items' must be an array"}
-            }), 400
+            return _error_response("INVALID_ITEMS_TYPE")
 
-        result = process_inventory_items(request_data)
+        # Aggregate-only mode via query flag (?summary_only=1)
+        summary_only = request.args.get('summary_only') == '1'
+        result = process_inventory_items(request_data, summary_only)
 
         if result["status"] == "failed":
-            return jsonify(result), 400
+            return _json_response(result, 400)
 
-        return jsonify(result), 200
+        return _json_response(result)
 
     except Exception as e:
-        logger.error(f"API error: {str(e)}")
-        return jsonify({
+        logger.error("API error: %s", e)
+        return _json_response({
             "error": "Internal server error",
             "code": "SERVER_ERROR",
             "details": {"message": str(e)}
-        }), 500
+        }, 500)
 
 
 @app.route('/api/v1/inventory/process-items-raw', methods=['POST'])
 def api_process_inventory_items_raw():
     """API endpoint for processing inventory items (raw array)."""
     try:
-        request_data = request.get_json()
+        request_data = _parse_json_request()
 
         if not request_data:
-            return jsonify({
-                "error": "Invalid request",
-                "code": "INVALID_JSON",
-                "details": {"message": "Request body must be valid JSON"}
-            }), 400
+            return _error_response("INVALID_JSON")
 
         # For raw arrays, request_data is directly the array
         if not isinstance(request_data, list):
-            return jsonify({
-                "error": "Invalid data type",
-                "code": "INVALID_TYPE",
-                "details": {"message": "Request body must be an array"}
-            }), 400
+            return _error_response("INVALID_TYPE")
 
         # Wrap the raw array for processing
         wrapped_data = {"items": request_data}
-        result = process_inventory_items(wrapped_data)
+        # Aggregate-only mode via query flag (?summary_only=1)
+        summary_only = request.args.get('summary_only') == '1'
+        result = process_inventory_items(wrapped_data, summary_only)
 
         if result["status"] == "failed":
-            return jsonify(result), 400
+            return _json_response(result, 400)
 
-        return jsonify(result), 200
+        return _json_response(result)
 
     except Exception as e:
-        logger.error(f"API error: {str(e)}")
-        return jsonify({
+        logger.error("API error: %s", e)
+        return _json_response({
             "error": "Internal server error",
             "code": "SERVER_ERROR",
             "details": {"message": str(e)}
-        }), 500
+        }, 500)
 
 
 @app.route('/api/v1/orders/process-batch', methods=['POST'])
 def api_process_batch_orders():
     """API endpoint for processing batch orders (nested wrapped arrays)."""
     try:
-        request_data = request.get_json()
+        request_data = _parse_json_request()
 
         if not request_data:
-            return jsonify({
-                "error": "Invalid request",
-                "code": "INVALID_JSON",
-                "details": {"message": "Request body must be valid JSON"}
-            }), 400
+            return _error_response("INVALID_JSON")
 
         # Validate wrapped array structure
         if "orders" not in request_data:
-            return jsonify({
-                "error": "Missing required field",
-                "code": "MISSING_ORDERS",
-                "details": {"message": "Request must contain 'orders' array"}
-            }), 400
+            return _error_response("MISSING_ORDERS")
 
         if not isinstance(request_data["orders"], list):
-            return jsonify({
-                "error": "Invalid data type",
-                "code": "INVALID_ORDERS_TYPE",
-                "details": {"message": "'orders' must be an array"}
-            }), 400
+            return _error_response("INVALID_ORDERS_TYPE")
 
-        result = process_batch_orders(request_data)
+        # Aggregate-only mode via query flag (?summary_only=1)
+        summary_only = request.args.get('summary_only') == '1'
+        result = process_batch_orders(request_data, summary_only)
 
         if result["status"] == "failed":
-            return jsonify(result), 400
+            return _json_response(result, 400)
 
-        return jsonify(result), 200
+        return _json_response(result)
 
     except Exception as e:
-        logger.error(f"API error: {str(e)}")
-        return jsonify({
+        logger.error("API error: %s", e)
+        return _json_response({
             "error": "Internal server error",
             "code": "SERVER_ERROR",
             "details": {"message": str(e)}
-        }), 500
+        }, 500)
 
 
 @app.route('/api/v1/orders/process-batch-raw', methods=['POST'])
 def api_process_batch_orders_raw():
     """API endpoint for processing batch orders (raw array)."""
     try:
-        request_data = request.get_json()
+        request_data = _parse_json_request()
 
         if not request_data:
-            return jsonify({
-                "error": "Invalid request",
-                "code": "INVALID_JSON",
-                "details": {"message": "Request body must be valid JSON"}
-            }), 400
+            return _error_response("INVALID_JSON")
 
         # For raw arrays, request_data is directly the array
         if not isinstance(request_data, list):
-            return jsonify({
-                "error": "Invalid data type",
-                "code": "INVALID_TYPE",
-                "details": {"message": "Request body must be an array"}
-            }), 400
+            return _error_response("INVALID_TYPE")
 
         # Wrap the raw array for processing
         wrapped_data = {"orders": request_data}
-        result = process_batch_orders(wrapped_data)
+        # Aggregate-only mode via query flag (?summary_only=1)
+        summary_only = request.args.get('summary_only') == '1'
+        result = process_batch_orders(wrapped_data, summary_only)
 
         if result["status"] == "failed":
-            return jsonify(result), 400
+            return _json_response(result, 400)
 
-        return jsonify(result), 200
+        return _json_response(result)
 
     except Exception as e:
-        logger.error(f"API error: {str(e)}")
-        return jsonify({
+        logger.error("API error: %s", e)
+        return _json_response({
             "error": "Internal server error",
             "code": "SERVER_ERROR",
             "details": {"message": str(e)}
-        }), 500
+        }, 500)
 
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    """Health check endpoint."""
-    return jsonify({
-        "status": "healthy",
-        "service": "Array Handling API",
-        "test_case": "TC-P0-API-002",
-        "version": "1.0.0"
-    }), 200
+    """Health check endpoint.
+
+    The payload is constant, so it is encoded once at import and the
+    handler returns the prebuilt bytes — no per-poll dict construction
+    or JSON encoding for a high-frequency probe.
+    """
+    if _HEALTH_BYTES is not None:
+        return app.response_class(_HEALTH_BYTES, mimetype='application/json')
+    return _json_response(_HEALTH_PAYLOAD)
 
 
 if __name__ == '__main__':
@@ -418,7 +595,10 @@ if __name__ == '__main__':
     print("  POST /api/v1/orders/process-batch (wrapped array)")
     print("  POST /api/v1/orders/process-batch-raw (raw array)")
     print("  GET  /health")
-    print("\nStarting server on http://0.0.0.0:8002")
+    port = int(os.environ.get('PORT', 8002))
+    debug = os.environ.get('DEBUG', 'False').lower() == 'true'
+
+    print(f"\nStarting server on http://0.0.0.0:{port}")
     print("="*70)
 
     # Demo: Process inventory items
@@ -515,7 +695,10 @@ if __name__ == '__main__':
 
     print("\n" + "="*70)
 
-    # Start Flask server
-    app.run(host='0.0.0.0', port=8002, debug=True)
+    # Start Flask server. threaded=True lets the dev server overlap
+    # requests instead of serializing all four endpoints; production
+    # deployments should front this WSGI app with a multi-worker server
+    # (e.g. gunicorn) instead of app.run
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
 
 # Made with Bob - Array Handling Test Implementation
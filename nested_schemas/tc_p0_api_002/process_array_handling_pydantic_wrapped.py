@@ -9,7 +9,7 @@ This demonstrates wrapped array patterns where:
 """
 from ibm_watsonx_orchestrate.agent_builder.tools import tool, ToolPermission
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from enum import Enum
 
 
@@ -21,6 +21,13 @@ class CategoryEnum(str, Enum):
     OFFICE_SUPPLIES = "Office Supplies"
 
 
+# Category order is fixed by the enum, so seen categories fit in a 4-bit
+# mask: one integer OR per item instead of a set hash+insert, and the
+# summary renders in stable enum order
+_CAT_IDX = {category: i for i, category in enumerate(CategoryEnum)}
+_CAT_VALS = tuple(category.value for category in CategoryEnum)
+
+
 class Specifications(BaseModel):
     """Product specifications model"""
     brand: Optional[str] = Field(None, description="Brand name")
@@ -32,7 +39,7 @@ class InventoryItem(BaseModel):
     """Inventory item model"""
     name: str = Field(..., description="Item name",
                       min_length=1, max_length=200)
-    sku: str = Field(..., description="Stock Keeping Unit",
+    sku: str = Field(..., description="Stock Keeping Unit (format: ABC-123)",
                      pattern=r'^[A-Z]{3}-[0-9]{3}$')
     quantity: int = Field(..., description="Quantity in stock", ge=0, le=10000)
     price: float = Field(..., description="Unit price", gt=0)
@@ -46,8 +53,8 @@ class InventoryRequest(BaseModel):
     items: List[InventoryItem] = Field(
         ...,
         description="List of inventory items to process (WRAPPED ARRAY - CORRECT)",
-        min_items=1,
-        max_items=100
+        min_length=1,
+        max_length=100
     )
 
 
@@ -65,7 +72,7 @@ class Order(BaseModel):
     items: List[OrderItem] = Field(
         ...,
         description="Order items (NESTED WRAPPED ARRAY - CORRECT)",
-        min_items=1
+        min_length=1
     )
 
 
@@ -74,10 +81,32 @@ class BatchOrderRequest(BaseModel):
     orders: List[Order] = Field(
         ...,
         description="List of orders to process (WRAPPED ARRAY - CORRECT)",
-        min_items=1
+        min_length=1
     )
 
 
+# Module-level adapters: pydantic-core validates the whole request tree in
+# one compiled pass, so callers holding raw dicts or JSON bytes skip the
+# per-model construction path. The tool signatures below keep their models
+# since Watson Orchestrate derives the tool schemas from them.
+_INVENTORY_ADAPTER = TypeAdapter(InventoryRequest)
+_BATCH_ADAPTER = TypeAdapter(BatchOrderRequest)
+
+
+def parse_inventory_request(payload) -> InventoryRequest:
+    """Validate a raw inventory payload (dict or JSON bytes) in one pass."""
+    if isinstance(payload, (bytes, bytearray, str)):
+        return _INVENTORY_ADAPTER.validate_json(payload)
+    return _INVENTORY_ADAPTER.validate_python(payload)
+
+
+def parse_batch_order_request(payload) -> BatchOrderRequest:
+    """Validate a raw batch order payload (dict or JSON bytes) in one pass."""
+    if isinstance(payload, (bytes, bytearray, str)):
+        return _BATCH_ADAPTER.validate_json(payload)
+    return _BATCH_ADAPTER.validate_python(payload)
+
+
 @tool(permission=ToolPermission.WRITE_ONLY)
 def process_inventory_items_wrapped(inventory_request: InventoryRequest) -> str:
     """
@@ -96,14 +125,32 @@ def process_inventory_items_wrapped(inventory_request: InventoryRequest) -> str:
     if not items:
         return "No items provided for processing."
 
-    processed_items = []
     total_value = 0.0
+    cat_mask = 0
+
+    # Assemble the report as a flat list of lines and join once at the
+    # end: linear allocation instead of re-concatenating a growing
+    # f-string around the pre-joined items block
+    buf = [
+        "╔══════════════════════════════════════════════════════════════════════════════╗",
+        "║                    INVENTORY PROCESSING RESULT (WRAPPED)                      ║",
+        "╚══════════════════════════════════════════════════════════════════════════════╝",
+        "",
+        "STATUS: SUCCESS",
+        f"MESSAGE: Successfully processed {len(items)} inventory items",
+        "",
+        "PROCESSED ITEMS:",
+    ]
+    append = buf.append
 
     for idx, item in enumerate(items):
         # Calculate item value
         item_value = item.quantity * item.price
         total_value += item_value
 
+        if item.category is not None:
+            cat_mask |= 1 << _CAT_IDX[item.category]
+
         # Extract specifications
         specs_info = "N/A"
         if item.specifications:
@@ -114,38 +161,26 @@ def process_inventory_items_wrapped(inventory_request: InventoryRequest) -> str:
             ]
             specs_info = ", ".join(filter(None, spec_parts))
 
-        processed_items.append(
-            f"  [{idx + 1}] {item.name} (SKU: {item.sku})\n"
-            f"      Category: {item.category.value if item.category else 'N/A'}\n"
-            f"      Quantity: {item.quantity}, Price: ${item.price:.2f}\n"
-            f"      Item Value: ${item_value:.2f}\n"
-            f"      Specifications: {specs_info}"
-        )
-
-    # Build result message
-    result = f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                    INVENTORY PROCESSING RESULT (WRAPPED)                      ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-STATUS: SUCCESS
-MESSAGE: Successfully processed {len(items)} inventory items
-
-PROCESSED ITEMS:
-{chr(10).join(processed_items)}
-
-SUMMARY:
-  Total Items: {len(items)}
-  Total Quantity: {sum(item.quantity for item in items)}
-  Total Value: ${total_value:.2f}
-  Categories: {', '.join(set(item.category.value for item in items if item.category))}
-
-╔══════════════════════════════════════════════════════════════════════════════╗
-║  Inventory processing complete with wrapped array structure                   ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-"""
+        append(f"  [{idx + 1}] {item.name} (SKU: {item.sku})")
+        append(
+            f"      Category: {item.category.value if item.category else 'N/A'}")
+        append(f"      Quantity: {item.quantity}, Price: ${item.price:.2f}")
+        append(f"      Item Value: ${item_value:.2f}")
+        append(f"      Specifications: {specs_info}")
 
-    return result.strip()
+    append("")
+    append("SUMMARY:")
+    append(f"  Total Items: {len(items)}")
+    append(f"  Total Quantity: {sum(item.quantity for item in items)}")
+    append(f"  Total Value: ${total_value:.2f}")
+    append(
+        f"  Categories: {', '.join(v for i, v in enumerate(_CAT_VALS) if cat_mask & (1 << i))}")
+    append("")
+    append("╔══════════════════════════════════════════════════════════════════════════════╗")
+    append("║  Inventory processing complete with wrapped array structure                   ║")
+    append("╚══════════════════════════════════════════════════════════════════════════════╝")
+
+    return "\n".join(buf)
 
 
 @tool(permission=ToolPermission.WRITE_ONLY)
@@ -166,54 +201,50 @@ def process_batch_orders_wrapped(batch_request: BatchOrderRequest) -> str:
     if not orders:
         return "No orders provided for processing."
 
-    processed_orders = []
     total_revenue = 0.0
 
+    # Same linear assembly as the inventory tool: append lines once,
+    # join once
+    buf = [
+        "╔══════════════════════════════════════════════════════════════════════════════╗",
+        "║                  BATCH ORDER PROCESSING RESULT (WRAPPED)                      ║",
+        "╚══════════════════════════════════════════════════════════════════════════════╝",
+        "",
+        "STATUS: SUCCESS",
+        f"MESSAGE: Successfully processed {len(orders)} batch orders",
+        "",
+        "PROCESSED ORDERS:",
+    ]
+    append = buf.append
+
     for order in orders:
         order_total = 0.0
-        items_summary = []
+
+        append(f"  Order: {order.order_id}")
+        append(f"    Customer: {order.customer_name}")
+        append(f"    Items ({len(order.items)}):")
 
         for item in order.items:
             item_total = item.quantity * item.unit_price
             order_total += item_total
 
-            items_summary.append(
-                f"      - {item.product_name}: {item.quantity} x ${item.unit_price:.2f} = ${item_total:.2f}"
-            )
+            append(
+                f"      - {item.product_name}: {item.quantity} x ${item.unit_price:.2f} = ${item_total:.2f}")
 
+        append(f"    Order Total: ${order_total:.2f}")
         total_revenue += order_total
 
-        processed_orders.append(
-            f"  Order: {order.order_id}\n"
-            f"    Customer: {order.customer_name}\n"
-            f"    Items ({len(order.items)}):\n"
-            f"{chr(10).join(items_summary)}\n"
-            f"    Order Total: ${order_total:.2f}"
-        )
-
-    # Build result message
-    result = f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                  BATCH ORDER PROCESSING RESULT (WRAPPED)                      ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-STATUS: SUCCESS
-MESSAGE: Successfully processed {len(orders)} batch orders
-
-PROCESSED ORDERS:
-{chr(10).join(processed_orders)}
-
-SUMMARY:
-  Total Orders: {len(orders)}
-  Total Revenue: ${total_revenue:.2f}
-  Average Order Value: ${total_revenue / len(orders):.2f}
-
-╔══════════════════════════════════════════════════════════════════════════════╗
-║  Batch processing complete with nested wrapped array structure                ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-"""
-
-    return result.strip()
+    append("")
+    append("SUMMARY:")
+    append(f"  Total Orders: {len(orders)}")
+    append(f"  Total Revenue: ${total_revenue:.2f}")
+    append(f"  Average Order Value: ${total_revenue / len(orders):.2f}")
+    append("")
+    append("╔══════════════════════════════════════════════════════════════════════════════╗")
+    append("║  Batch processing complete with nested wrapped array structure                ║")
+    append("╚══════════════════════════════════════════════════════════════════════════════╝")
+
+    return "\n".join(buf)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,23 @@
+"""Shared address formatting for the customer order tools.
+
+Both process_customer_order and process_nested_reference format the same
+five-field address shape; keeping one hot helper here means every
+address call in an order goes through the same compiled code object.
+"""
+
+
+def format_address(street, city, state, zipcode, country, default=""):
+    """Join the non-empty address parts with ", ", or return default.
+
+    Args:
+        street, city, state, zipcode, country: Address parts; falsy parts
+            are skipped.
+        default (str): Returned when every part is empty.
+
+    Returns:
+        str: The joined address or the default.
+    """
+    parts = [street, city, state, zipcode, country]
+    return ", ".join([p for p in parts if p]) or default
+
+# Made with Bob
@@ -20,120 +20,171 @@ Input: Customer order with personal info, address, and product details
 Output: Clean, formatted order confirmation with all details
 """
 
+import json
+from copy import deepcopy
+from functools import lru_cache
 from typing import Dict, Any
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; small carts don't need it
+    np = None
 
-def process_customer_order(order_data: dict) -> dict:
-    """Process customer order and return a formatted order confirmation.
+# The module is imported both as part of the tc_p0_py_001 package (the
+# root API server) and flat with this directory on sys.path (tool
+# discovery, running as a script), so try the package-relative form first
+try:
+    from ._address_util import format_address
+except ImportError:
+    from _address_util import format_address
 
-    This tool processes customer orders including customer information, shipping and billing
-    addresses, and product details with specifications. It handles nested data structures
-    and returns a user-friendly order confirmation.
+# Below this cart size the array setup costs more than the Python loop saves
+_VECTORIZE_MIN_ITEMS = 64
 
-    Provide customer name, email, address, order ID, and product details including specifications
-    like weight, dimensions, and material. The tool will create a complete order confirmation.
 
-    Args:
-        order_data (dict): Order information with customer details (name, email, address with street/city/state/zipcode/country), order details (order_id, items with product specifications), and shipping/billing addresses.
+def _format_address(address) -> str:
+    """Format a dict-shaped address through the shared helper.
 
-    Returns:
-        dict: Formatted order confirmation with customer info, order summary, shipping details, and product information in user-friendly format.
+    Returns "" for a missing, null, or empty address so callers pick
+    their own fallback. Payloads may carry an explicit null for the
+    optional address keys, so the guard lives here rather than at every
+    call site.
     """
-    result = {}
+    if not address:
+        return ""
+    return format_address(address.get("street"), address.get("city"),
+                          address.get("state"), address.get("zipcode"),
+                          address.get("country"))
+
 
+def _process_customer_order(order_data: dict) -> dict:
+    """Uncached order processing; process_customer_order memoizes this."""
     # Extract customer information
     customer = order_data.get("customer", {})
-    result["customer_name"] = customer.get("name", "Unknown")
-    result["customer_email"] = customer.get("email", "Not provided")
-
-    # Format customer address
-    address = customer.get("address", {})
-    if address:
-        address_parts = [
-            address.get("street", ""),
-            address.get("city", ""),
-            address.get("state", ""),
-            address.get("zipcode", ""),
-            address.get("country", "")
-        ]
-        result["customer_address"] = ", ".join([p for p in address_parts if p])
-    else:
-        result["customer_address"] = "Not provided"
-
-    # Extract contact info
+    customer_name = customer.get("name", "Unknown")
+    customer_address = _format_address(
+        customer.get("address", {})) or "Not provided"
     contact = customer.get("contact", {})
-    result["phone"] = contact.get("phone", "Not provided")
-    result["mobile"] = contact.get("mobile", "Not provided")
 
     # Extract order information
     order = order_data.get("order", {})
-    result["order_id"] = order.get("order_id", "Unknown")
-    result["order_date"] = order.get("order_date", "Not specified")
+    order_id = order.get("order_id", "Unknown")
 
     # Process order items
     items = order.get("items", [])
-    result["items"] = []
-    result["total_items"] = len(items)
-    result["total_amount"] = 0.0
-
-    for item in items:
+    items_out = []
+    total_amount = 0.0
+
+    # For large carts compute every subtotal and the total in one
+    # vectorized multiply+reduce instead of N interpreter round-trips
+    subtotals = None
+    if np is not None and len(items) >= _VECTORIZE_MIN_ITEMS:
+        # float64, not int64: quantities are not constrained to whole
+        # numbers and an integer dtype would silently truncate them
+        quantities = np.fromiter(
+            (item.get("quantity", 1) for item in items),
+            dtype=np.float64, count=len(items))
+        prices = np.fromiter(
+            (item.get("price", 0.0) for item in items),
+            dtype=np.float64, count=len(items))
+        values = quantities * prices
+        total_amount = float(values.sum())
+        subtotals = values.tolist()
+
+    for idx, item in enumerate(items):
         product = item.get("product", {})
         details = product.get("details", {})
         specs = details.get("specifications", {})
 
+        quantity = item.get("quantity", 1)
+        price = item.get("price", 0.0)
+        subtotal = subtotals[idx] if subtotals is not None else quantity * price
+
         item_info = {
             "product_name": product.get("name", "Unknown Product"),
             "product_id": product.get("product_id", ""),
             "description": details.get("description", ""),
-            "quantity": item.get("quantity", 1),
-            "price": item.get("price", 0.0),
-            "subtotal": item.get("quantity", 1) * item.get("price", 0.0)
+            "quantity": quantity,
+            "price": price,
+            "subtotal": subtotal
         }
 
         # Add specifications if available
         if specs:
             item_info["specifications"] = f"{specs.get('weight', '')}, {specs.get('dimensions', '')}, {specs.get('material', '')}"
 
-        result["items"].append(item_info)
-        result["total_amount"] += item_info["subtotal"]
-
-    # Format shipping address
-    shipping = order.get("shipping_address", {})
-    if shipping:
-        shipping_parts = [
-            shipping.get("street", ""),
-            shipping.get("city", ""),
-            shipping.get("state", ""),
-            shipping.get("zipcode", ""),
-            shipping.get("country", "")
-        ]
-        result["shipping_address"] = ", ".join(
-            [p for p in shipping_parts if p])
-    else:
-        result["shipping_address"] = result["customer_address"]
-
-    # Format billing address
-    billing = order.get("billing_address", {})
-    if billing:
-        billing_parts = [
-            billing.get("street", ""),
-            billing.get("city", ""),
-            billing.get("state", ""),
-            billing.get("zipcode", ""),
-            billing.get("country", "")
-        ]
-        result["billing_address"] = ", ".join([p for p in billing_parts if p])
-    else:
-        result["billing_address"] = result["customer_address"]
-
-    # Create confirmation message
-    result["confirmation_message"] = f"Order {result['order_id']} confirmed for {result['customer_name']}"
-    result["order_summary"] = f"{result['total_items']} item(s), Total: ${result['total_amount']:.2f}"
-
-    return result
+        items_out.append(item_info)
+        if subtotals is None:
+            total_amount += subtotal
+
+    # Build the confirmation in one dict literal so the interpreter
+    # allocates it at final size instead of resizing key by key
+    return {
+        "customer_name": customer_name,
+        "customer_email": customer.get("email", "Not provided"),
+        "customer_address": customer_address,
+        "phone": contact.get("phone", "Not provided"),
+        "mobile": contact.get("mobile", "Not provided"),
+        "order_id": order_id,
+        "order_date": order.get("order_date", "Not specified"),
+        "items": items_out,
+        "total_items": len(items),
+        "total_amount": total_amount,
+        # Shipping and billing fall back to the customer address
+        "shipping_address": _format_address(
+            order.get("shipping_address", {})) or customer_address,
+        "billing_address": _format_address(
+            order.get("billing_address", {})) or customer_address,
+        "confirmation_message": f"Order {order_id} confirmed for {customer_name}",
+        "order_summary": f"{len(items)} item(s), Total: ${total_amount:.2f}"
+    }
+
 
+@lru_cache(maxsize=4096)
+def _cached_order_result(order_json: str) -> dict:
+    """Compute and keep the confirmation for one canonical order payload."""
+    return _process_customer_order(json.loads(order_json))
 
-if __name__ == '__main__':
+
+def process_customer_order(order_data: dict) -> dict:
+    """Process customer order and return a formatted order confirmation.
+
+    This tool processes customer orders including customer information, shipping and billing
+    addresses, and product details with specifications. It handles nested data structures
+    and returns a user-friendly order confirmation.
+
+    Provide customer name, email, address, order ID, and product details including specifications
+    like weight, dimensions, and material. The tool will create a complete order confirmation.
+
+    Processing is deterministic with no side effects, so results are memoized
+    on the canonical JSON form of the payload: retried or idempotency-key
+    resubmissions of the same order cost one dict lookup and a copy instead
+    of the full nested traversal. Each caller gets its own deep copy, so
+    mutating a returned confirmation never affects other callers.
+
+    Args:
+        order_data (dict): Order information with customer details (name, email, address with street/city/state/zipcode/country), order details (order_id, items with product specifications), and shipping/billing addresses.
+
+    Returns:
+        dict: Formatted order confirmation with customer info, order summary, shipping details, and product information in user-friendly format.
+    """
+    try:
+        key = json.dumps(order_data, sort_keys=True, separators=(",", ":"))
+    except TypeError:
+        # Non-JSON-serializable payloads can't be cache keys; process directly
+        return _process_customer_order(order_data)
+    # Deep copy so callers can mutate (or jsonify) their confirmation
+    # without touching the cached entry
+    return deepcopy(_cached_order_result(key))
+
+
+def _run_demo():
+    """Exercise the tool with the demo payloads.
+
+    Demos live in a function so the large literal payloads are plain
+    function bytecode, not module-level code executed and held at
+    import time by tool discovery.
+    """
     # Demo: Process customer order
     print("="*70)
     print("Customer Order Processing Demo")
@@ -223,4 +274,9 @@ if __name__ == '__main__':
 
     print(f"\nTotal Amount: ${result['total_amount']:.2f}")
 
+
+
+if __name__ == '__main__':
+    _run_demo()
+
 # Made with Bob - Real-world order processing tool
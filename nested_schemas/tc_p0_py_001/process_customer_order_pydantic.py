@@ -280,7 +280,13 @@ CONFIRMATION MESSAGE:
     return confirmation.strip()
 
 
-if __name__ == '__main__':
+def _run_demo():
+    """Exercise the tool with the demo payloads.
+
+    Demos live in a function so the large literal payloads are plain
+    function bytecode, not module-level code executed and held at
+    import time by tool discovery.
+    """
     # Example 1: Complete order with all nested references
     print("=" * 80)
     print("Example 1: Complete order with nested address references")
@@ -392,4 +398,9 @@ if __name__ == '__main__':
     result = process_customer_order_with_references(minimal_order)
     print(result)
 
+
+
+if __name__ == '__main__':
+    _run_demo()
+
 # Made with Bob
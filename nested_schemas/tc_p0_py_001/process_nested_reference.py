@@ -8,8 +8,15 @@ This demonstrates the nested reference pattern from GitHub Issue #45755 where:
 - Similar to how alerts.address referenced inquiry.address in Moody's MCP tools
 """
 from ibm_watsonx_orchestrate.agent_builder.tools import tool, ToolPermission
+# Imported both as part of the tc_p0_py_001 package and flat with this
+# directory on sys.path, so try the package-relative form first
+try:
+    from ._address_util import format_address
+except ImportError:
+    from _address_util import format_address
 from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr
+from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, TypeAdapter
 from enum import Enum
 
 
@@ -19,33 +26,37 @@ class EntityType(str, Enum):
     BUSINESS = "BUSINESS"
 
 
-class Contact(BaseModel):
-    """Contact information model"""
-    phone: Optional[str] = Field(None, description="Primary phone number")
-    mobile: Optional[str] = Field(None, description="Mobile phone number")
+# Leaf structures are TypedDicts rather than BaseModels: they are never
+# exposed standalone and only get read back out for formatting, so the
+# per-field validator machinery a nested BaseModel runs for every item
+# and shipping location is pure overhead. Pydantic v2 still validates
+# TypedDict fields (and derives their schema) via a much lighter path.
+class Contact(TypedDict, total=False):
+    """Contact information structure"""
+    phone: Optional[str]
+    mobile: Optional[str]
 
 
-class Address(BaseModel):
+class Address(TypedDict, total=False):
     """Address structure used by customer, order, and shipping locations"""
-    street: Optional[str] = Field(None, description="Street address")
-    city: Optional[str] = Field(None, description="City name")
-    state: Optional[str] = Field(None, description="State or province")
-    zipcode: Optional[str] = Field(None, description="Postal code")
-    country: Optional[str] = Field(None, description="Country name")
+    street: Optional[str]
+    city: Optional[str]
+    state: Optional[str]
+    zipcode: Optional[str]
+    country: Optional[str]
 
 
-class ProductSpecifications(BaseModel):
-    """Product specifications model"""
-    weight: Optional[str] = Field(None, description="Product weight")
-    dimensions: Optional[str] = Field(None, description="Product dimensions")
-    material: Optional[str] = Field(None, description="Product material")
+class ProductSpecifications(TypedDict, total=False):
+    """Product specifications structure"""
+    weight: Optional[str]
+    dimensions: Optional[str]
+    material: Optional[str]
 
 
-class ProductDetails(BaseModel):
-    """Product details model"""
-    description: Optional[str] = Field(None, description="Product description")
-    specifications: Optional[ProductSpecifications] = Field(
-        None, description="Product specifications")
+class ProductDetails(TypedDict, total=False):
+    """Product details structure"""
+    description: Optional[str]
+    specifications: Optional[ProductSpecifications]
 
 
 class Product(BaseModel):
@@ -68,11 +79,10 @@ class OrderItem(BaseModel):
     )
 
 
-class LocationContact(BaseModel):
+class LocationContact(TypedDict, total=False):
     """Location contact information"""
-    phone: Optional[str] = Field(None, description="Location phone number")
-    email: Optional[EmailStr] = Field(
-        None, description="Location email address")
+    phone: Optional[str]
+    email: Optional[EmailStr]
 
 
 class ShippingLocation(BaseModel):
@@ -128,12 +138,28 @@ class OrderRequestWithReferences(BaseModel):
     - order.items.delivery_address references customer.address
     - Similar to alerts.address referencing inquiry.address in Moody's tools
     """
+    model_config = ConfigDict(extra='ignore')
+
     customer: Customer = Field(...,
                                description="Customer information with primary address")
     order: Order = Field(...,
                          description="Order details with nested references")
 
 
+# Module-level adapter: building the validation tree once and reusing the
+# compiled SchemaValidator beats re-entering Model(**data) per request.
+# API handlers validating raw payloads should go through this instead of
+# constructing the model keyword-by-keyword.
+_ORDER_ADAPTER = TypeAdapter(OrderRequestWithReferences)
+
+
+def parse_order_request(payload) -> OrderRequestWithReferences:
+    """Validate a raw order payload (dict or JSON bytes) in one pass."""
+    if isinstance(payload, (bytes, bytearray, str)):
+        return _ORDER_ADAPTER.validate_json(payload)
+    return _ORDER_ADAPTER.validate_python(payload)
+
+
 @tool(permission=ToolPermission.WRITE_ONLY)
 def process_customer_order_with_references(order_request: OrderRequestWithReferences) -> str:
     """
@@ -154,19 +180,17 @@ def process_customer_order_with_references(order_request: OrderRequestWithRefere
     customer_id = order_request.customer.customerId or "N/A"
 
     # Format customer address
-    customer_address = "N/A"
-    if order_request.customer.address:
-        addr = order_request.customer.address
-        parts = [addr.street, addr.city,
-                 addr.state, addr.zipcode, addr.country]
-        customer_address = ", ".join(filter(None, parts))
+    addr = order_request.customer.address or {}
+    customer_address = format_address(
+        addr.get("street"), addr.get("city"), addr.get("state"),
+        addr.get("zipcode"), addr.get("country"), default="N/A")
 
     # Extract contact information
     phone = "N/A"
     mobile = "N/A"
     if order_request.customer.contact:
-        phone = order_request.customer.contact.phone or "N/A"
-        mobile = order_request.customer.contact.mobile or "N/A"
+        phone = order_request.customer.contact.get("phone") or "N/A"
+        mobile = order_request.customer.contact.get("mobile") or "N/A"
 
     # Extract order information
     order_id = order_request.order.order_id
@@ -183,39 +207,39 @@ def process_customer_order_with_references(order_request: OrderRequestWithRefere
             total_amount += subtotal
             total_items += item.quantity
 
+            # One Rust-side dump of the product replaces repeated
+            # Python-level attribute dispatch down the model chain
+            prod = item.product.model_dump()
+
             # Get product specifications
             specs = "N/A"
-            if item.product.details and item.product.details.specifications:
-                spec = item.product.details.specifications
-                spec_parts = [spec.weight, spec.dimensions, spec.material]
-                specs = ", ".join(filter(None, spec_parts))
+            spec = (prod.get("details") or {}).get("specifications")
+            if spec:
+                spec_parts = [spec.get("weight"), spec.get("dimensions"),
+                              spec.get("material")]
+                specs = ", ".join([p for p in spec_parts if p])
 
             # Count delivery addresses
             delivery_addr_count = len(
                 item.delivery_address) if item.delivery_address else 0
 
             items_summary.append(
-                f"  - {item.product.name} (ID: {item.product.product_id or 'N/A'})\n"
+                f"  - {prod['name']} (ID: {prod.get('product_id') or 'N/A'})\n"
                 f"    Qty: {item.quantity}, Price: ${item.price:.2f}, Subtotal: ${subtotal:.2f}\n"
                 f"    Specs: {specs}\n"
                 f"    Delivery Addresses: {delivery_addr_count}"
             )
 
-    # Format shipping address
-    shipping_address = "N/A"
-    if order_request.order.shipping_address:
-        addr = order_request.order.shipping_address
-        parts = [addr.street, addr.city,
-                 addr.state, addr.zipcode, addr.country]
-        shipping_address = ", ".join(filter(None, parts))
-
-    # Format billing address
-    billing_address = "N/A"
-    if order_request.order.billing_address:
-        addr = order_request.order.billing_address
-        parts = [addr.street, addr.city,
-                 addr.state, addr.zipcode, addr.country]
-        billing_address = ", ".join(filter(None, parts))
+    # Format shipping and billing addresses
+    addr = order_request.order.shipping_address or {}
+    shipping_address = format_address(
+        addr.get("street"), addr.get("city"), addr.get("state"),
+        addr.get("zipcode"), addr.get("country"), default="N/A")
+
+    addr = order_request.order.billing_address or {}
+    billing_address = format_address(
+        addr.get("street"), addr.get("city"), addr.get("state"),
+        addr.get("zipcode"), addr.get("country"), default="N/A")
 
     # Process shipping locations
     shipping_locations_count = 0
@@ -226,8 +250,9 @@ def process_customer_order_with_references(order_request: OrderRequestWithRefere
             addr_count = len(loc.address) if loc.address else 0
             contact_info = "N/A"
             if loc.contact:
-                contact_parts = [loc.contact.phone, loc.contact.email]
-                contact_info = ", ".join(filter(None, contact_parts))
+                contact_parts = [loc.contact.get("phone"),
+                                 loc.contact.get("email")]
+                contact_info = ", ".join([p for p in contact_parts if p])
 
             shipping_locations_summary.append(
                 f"  - {loc.location_name} (ID: {loc.location_id})\n"
@@ -235,52 +260,70 @@ def process_customer_order_with_references(order_request: OrderRequestWithRefere
                 f"    Contact: {contact_info}"
             )
 
-    # Build confirmation message
-    confirmation = f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                        ORDER CONFIRMATION                                     ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-ORDER DETAILS:
-  Order ID: {order_id}
-  Order Date: {order_date}
-  Status: CONFIRMED
-
-CUSTOMER INFORMATION:
-  Name: {customer_name}
-  Email: {customer_email}
-  Entity Type: {customer_entity}
-  Customer ID: {customer_id}
-  Address: {customer_address}
-  Phone: {phone}
-  Mobile: {mobile}
-
-ORDER ITEMS ({total_items} item(s)):
-{chr(10).join(items_summary) if items_summary else "  No items"}
-
-SHIPPING INFORMATION:
-  Shipping Address: {shipping_address}
-  Billing Address: {billing_address}
-  Shipping Locations: {shipping_locations_count}
-
-{chr(10).join(shipping_locations_summary) if shipping_locations_summary else ""}
-
-ORDER SUMMARY:
-  Total Items: {total_items}
-  Total Amount: ${total_amount:.2f}
-
-CONFIRMATION MESSAGE:
-  Order {order_id} confirmed for {customer_name}
-
-╔══════════════════════════════════════════════════════════════════════════════╗
-║  Thank you for your order! Your order is being processed.                    ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-"""
-
-    return confirmation.strip()
-
-
-if __name__ == '__main__':
+    # Build the confirmation as a flat list of lines joined once at the
+    # end: the item and shipping-location blocks extend the list directly
+    # instead of being pre-joined and substituted into an outer f-string
+    buf = [
+        "╔══════════════════════════════════════════════════════════════════════════════╗",
+        "║                        ORDER CONFIRMATION                                     ║",
+        "╚══════════════════════════════════════════════════════════════════════════════╝",
+        "",
+        "ORDER DETAILS:",
+        f"  Order ID: {order_id}",
+        f"  Order Date: {order_date}",
+        "  Status: CONFIRMED",
+        "",
+        "CUSTOMER INFORMATION:",
+        f"  Name: {customer_name}",
+        f"  Email: {customer_email}",
+        f"  Entity Type: {customer_entity}",
+        f"  Customer ID: {customer_id}",
+        f"  Address: {customer_address}",
+        f"  Phone: {phone}",
+        f"  Mobile: {mobile}",
+        "",
+        f"ORDER ITEMS ({total_items} item(s)):",
+    ]
+
+    if items_summary:
+        buf.extend(items_summary)
+    else:
+        buf.append("  No items")
+
+    buf.append("")
+    buf.append("SHIPPING INFORMATION:")
+    buf.append(f"  Shipping Address: {shipping_address}")
+    buf.append(f"  Billing Address: {billing_address}")
+    buf.append(f"  Shipping Locations: {shipping_locations_count}")
+    buf.append("")
+
+    if shipping_locations_summary:
+        buf.extend(shipping_locations_summary)
+    else:
+        buf.append("")
+
+    buf.append("")
+    buf.append("ORDER SUMMARY:")
+    buf.append(f"  Total Items: {total_items}")
+    buf.append(f"  Total Amount: ${total_amount:.2f}")
+    buf.append("")
+    buf.append("CONFIRMATION MESSAGE:")
+    buf.append(f"  Order {order_id} confirmed for {customer_name}")
+    buf.append("")
+    buf.append("╔══════════════════════════════════════════════════════════════════════════════╗")
+    buf.append("║  Thank you for your order! Your order is being processed.                    ║")
+    buf.append("╚══════════════════════════════════════════════════════════════════════════════╝")
+
+    return "\n".join(buf)
+
+
+def _run_demo():
+    """Exercise the tool with the demo payloads.
+
+    Demos live in a function so the large literal payloads are plain
+    function bytecode, not module-level code executed and held at
+    import time by tool discovery.
+    """
     # Example 1: Complete order with all nested references
     print("=" * 80)
     print("Example 1: Complete order with nested address references")
@@ -290,17 +333,17 @@ if __name__ == '__main__':
         customer=Customer(
             name="Jane Smith",
             email="jane.smith@email.com",
-            address=Address(
-                street="456 Oak Avenue",
-                city="New York",
-                state="NY",
-                zipcode="10001",
-                country="USA"
-            ),
-            contact=Contact(
-                phone="+1-555-0200",
-                mobile="+1-555-0201"
-            ),
+            address={
+                "street": "456 Oak Avenue",
+                "city": "New York",
+                "state": "NY",
+                "zipcode": "10001",
+                "country": "USA"
+            },
+            contact={
+                "phone": "+1-555-0200",
+                "mobile": "+1-555-0201"
+            },
             entityType=EntityType.INDIVIDUAL,
             customerId="CUST-001"
         ),
@@ -312,60 +355,60 @@ if __name__ == '__main__':
                     product=Product(
                         product_id="PROD-001",
                         name="Premium Laptop",
-                        details=ProductDetails(
-                            description="High-performance laptop for professionals",
-                            specifications=ProductSpecifications(
-                                weight="1.5 kg",
-                                dimensions="35cm x 25cm x 2cm",
-                                material="Aluminum alloy"
-                            )
-                        )
+                        details={
+                            "description": "High-performance laptop for professionals",
+                            "specifications": {
+                                "weight": "1.5 kg",
+                                "dimensions": "35cm x 25cm x 2cm",
+                                "material": "Aluminum alloy"
+                            }
+                        }
                     ),
                     quantity=1,
                     price=1299.99,
                     delivery_address=[
-                        Address(
-                            street="456 Oak Avenue",
-                            city="New York",
-                            state="NY",
-                            zipcode="10001",
-                            country="USA"
-                        )
+                        {
+                            "street": "456 Oak Avenue",
+                            "city": "New York",
+                            "state": "NY",
+                            "zipcode": "10001",
+                            "country": "USA"
+                        }
                     ]
                 )
             ],
-            shipping_address=Address(
-                street="456 Oak Avenue",
-                city="New York",
-                state="NY",
-                zipcode="10001",
-                country="USA"
-            ),
-            billing_address=Address(
-                street="789 Pine Street",
-                city="New York",
-                state="NY",
-                zipcode="10002",
-                country="USA"
-            ),
+            shipping_address={
+                "street": "456 Oak Avenue",
+                "city": "New York",
+                "state": "NY",
+                "zipcode": "10001",
+                "country": "USA"
+            },
+            billing_address={
+                "street": "789 Pine Street",
+                "city": "New York",
+                "state": "NY",
+                "zipcode": "10002",
+                "country": "USA"
+            },
             shipping_locations=[
                 ShippingLocation(
                     location_id="LOC-001",
                     location_name="Primary Warehouse",
                     address=[
-                        Address(
-                            street="456 Oak Avenue",
-                            city="New York",
-                            state="NY",
-                            zipcode="10001",
-                            country="USA"
-                        )
+                        {
+                            "street": "456 Oak Avenue",
+                            "city": "New York",
+                            "state": "NY",
+                            "zipcode": "10001",
+                            "country": "USA"
+                        }
                     ],
                     entityType="WAREHOUSE",
-                    contact=LocationContact(
-                        phone="+1-555-0300",
-                        email="warehouse@example.com"
-                    )
+                    contact={
+                        "phone": "+1-555-0300",
+                        "email": "warehouse@example.com"
+                    }
                 )
             ]
         )
@@ -392,4 +435,9 @@ if __name__ == '__main__':
     result = process_customer_order_with_references(minimal_order)
     print(result)
 
+
+
+if __name__ == '__main__':
+    _run_demo()
+
 # Made with Bob
@@ -0,0 +1,143 @@
+"""Demo payloads and walkthrough for the employee registration tool.
+
+Kept out of register_employee.py so importing the tool (tool discovery,
+the API server) never compiles or holds the large demo literals; this
+module only loads when the tool is run as a script.
+"""
+
+from register_employee import register_employee
+
+
+def run():
+    """Run the three registration demos and print their confirmations."""
+    # Demo 1: Register employee with manager
+    print("="*70)
+    print("Demo 1: Register Employee with Manager")
+    print("="*70)
+
+    registration_data_1 = {
+        "employee": {
+            "name": "Sarah Martinez",
+            "employee_id": "EMP-201",
+            "email": "sarah.martinez@company.com",
+            "phone": "+1-555-0201",
+            "department": "Engineering",
+            "position": "Software Engineer",
+            "start_date": "2024-02-01",
+            "manager": {
+                "name": "Michael Chen",
+                "employee_id": "EMP-150",
+                "email": "michael.chen@company.com",
+                "phone": "+1-555-0150",
+                "department": "Engineering",
+                "position": "Engineering Manager",
+                "start_date": "2022-05-15"
+            }
+        }
+    }
+
+    result = register_employee(registration_data_1)
+    print(f"\nStatus: {result['status']}")
+    print(f"Message: {result['message']}")
+    print(f"\nEmployee:")
+    print(f"  Name: {result['employee']['name']}")
+    print(f"  ID: {result['employee']['employee_id']}")
+    print(f"  Department: {result['employee']['department']}")
+    print(f"  Position: {result['employee']['position']}")
+    print(f"  Start Date: {result['employee']['start_date']}")
+    print(f"\nManager:")
+    if result['manager']:
+        print(f"  Name: {result['manager']['name']}")
+        print(f"  ID: {result['manager']['employee_id']}")
+        print(f"  Position: {result['manager']['position']}")
+    print(f"\nReporting Chain: {result['reporting_chain']}")
+    print(f"Registration Date: {result['registration_date']}")
+
+    # Demo 2: Register senior employee with multi-level hierarchy
+    print("\n" + "="*70)
+    print("Demo 2: Register Senior Employee with Multi-Level Hierarchy")
+    print("="*70)
+
+    registration_data_2 = {
+        "employee": {
+            "name": "James Wilson",
+            "employee_id": "EMP-202",
+            "email": "james.wilson@company.com",
+            "phone": "+1-555-0202",
+            "department": "Product",
+            "position": "Senior Product Manager",
+            "start_date": "2024-03-01",
+            "manager": {
+                "name": "Lisa Anderson",
+                "employee_id": "EMP-100",
+                "email": "lisa.anderson@company.com",
+                "phone": "+1-555-0100",
+                "department": "Product",
+                "position": "VP of Product",
+                "start_date": "2020-01-10",
+                "manager": {
+                    "name": "Robert Taylor",
+                    "employee_id": "EMP-001",
+                    "email": "robert.taylor@company.com",
+                    "phone": "+1-555-0001",
+                    "department": "Executive",
+                    "position": "Chief Product Officer",
+                    "start_date": "2018-06-01"
+                }
+            }
+        }
+    }
+
+    result = register_employee(registration_data_2)
+    print(f"\nStatus: {result['status']}")
+    print(f"Message: {result['message']}")
+    print(f"\nEmployee:")
+    print(f"  Name: {result['employee']['name']}")
+    print(f"  ID: {result['employee']['employee_id']}")
+    print(f"  Department: {result['employee']['department']}")
+    print(f"  Position: {result['employee']['position']}")
+    print(f"\nManager:")
+    if result['manager']:
+        print(f"  Name: {result['manager']['name']}")
+        print(f"  ID: {result['manager']['employee_id']}")
+        print(f"  Position: {result['manager']['position']}")
+    print(f"\nReporting Chain: {result['reporting_chain']}")
+    print(f"Hierarchy Levels: {result.get('hierarchy_levels', 1)}")
+    print(f"Registration Date: {result['registration_date']}")
+
+    # Demo 3: Register top-level executive (no manager)
+    print("\n" + "="*70)
+    print("Demo 3: Register Top-Level Executive (No Manager)")
+    print("="*70)
+
+    registration_data_3 = {
+        "employee": {
+            "name": "Jennifer Lee",
+            "employee_id": "EMP-001",
+            "email": "jennifer.lee@company.com",
+            "phone": "+1-555-0001",
+            "department": "Executive",
+            "position": "Chief Executive Officer",
+            "start_date": "2015-01-01"
+        }
+    }
+
+    result = register_employee(registration_data_3)
+    print(f"\nStatus: {result['status']}")
+    print(f"Message: {result['message']}")
+    print(f"\nEmployee:")
+    print(f"  Name: {result['employee']['name']}")
+    print(f"  ID: {result['employee']['employee_id']}")
+    print(f"  Department: {result['employee']['department']}")
+    print(f"  Position: {result['employee']['position']}")
+    print(f"\nManager: {result['manager']}")
+    if 'note' in result:
+        print(f"Note: {result['note']}")
+    print(f"\nReporting Chain: {result['reporting_chain']}")
+    print(f"Registration Date: {result['registration_date']}")
+
+
+if __name__ == '__main__':
+    run()
+
+# Made with Bob
@@ -18,19 +18,64 @@ Endpoints:
 
 from register_employee import register_employee
 import os
-import sys
 from flask import Flask, request, jsonify, send_file
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-import yaml
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(__file__))
-
-# Import the registration function
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask keeps its stdlib provider
+    orjson = None
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
+
+class _OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson's C (de)serializer.
+
+    Routes request.get_json() and every jsonify() through orjson, which
+    is the dominant cost for the small POST handlers here whose business
+    logic is a few dict reads.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+# The spec is static, so it is parsed once on the first request and the
+# dict reused for every GET /api/v1/openapi after that. yaml itself is
+# imported lazily here so tool-discovery imports of this module skip
+# both the yaml import and the parse.
+_OPENAPI_PATH = os.path.join(os.path.dirname(
+    __file__), 'openapi_add_employee_with_manager.yaml')
+_OPENAPI_SPEC = None
+_OPENAPI_LOADED = False
+
+
+def _load_openapi_spec():
+    """Parse the OpenAPI YAML once, preferring libyaml's CSafeLoader."""
+    global _OPENAPI_SPEC, _OPENAPI_LOADED
+    if not _OPENAPI_LOADED:
+        import yaml
+        try:
+            from yaml import CSafeLoader as _YamlLoader
+        except ImportError:  # libyaml not compiled in; pure-Python fallback
+            from yaml import SafeLoader as _YamlLoader
+        try:
+            with open(_OPENAPI_PATH, 'r') as f:
+                _OPENAPI_SPEC = yaml.load(f, Loader=_YamlLoader)
+        except (FileNotFoundError, yaml.YAMLError):
+            _OPENAPI_SPEC = None
+        _OPENAPI_LOADED = True
+    return _OPENAPI_SPEC
+
 # Health check endpoint
 
 
@@ -90,26 +135,14 @@ def register_employee_endpoint():
 
 @app.route('/api/v1/openapi', methods=['GET'])
 def get_openapi_spec():
-    """Get OpenAPI specification"""
-    try:
-        openapi_path = os.path.join(os.path.dirname(
-            __file__), 'openapi_add_employee_with_manager.yaml')
-
-        if not os.path.exists(openapi_path):
-            return jsonify({
-                'error': 'OpenAPI specification not found'
-            }), 404
-
-        with open(openapi_path, 'r') as f:
-            spec = yaml.safe_load(f)
-
-        return jsonify(spec), 200
-
-    except Exception as e:
+    """Get OpenAPI specification (parsed once on first request)"""
+    spec = _load_openapi_spec()
+    if spec is None:
         return jsonify({
-            'error': 'Failed to load OpenAPI specification',
-            'details': str(e)
-        }), 500
+            'error': 'OpenAPI specification not found'
+        }), 404
+
+    return jsonify(spec), 200
 
 # Root endpoint
 
@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the Employee Registration API.
+
+Replaces the bare `gunicorn api_server:app` start command so the server
+runs with threaded workers instead of Werkzeug's single-threaded dev
+server semantics. preload_app imports api_server once in the master
+process, so the parsed OpenAPI spec and the JSON provider are built a
+single time and shared copy-on-write across workers.
+
+Usage:
+    gunicorn -c gunicorn_conf.py api_server:app
+"""
+import os
+
+bind = "0.0.0.0:" + os.environ.get("PORT", "5000")
+workers = max(2, os.cpu_count() or 1)
+worker_class = "gthread"
+threads = 4
+preload_app = True
+
+# Made with Bob
@@ -21,8 +21,66 @@ Input: Employee information including manager details (both using Person schema)
 Output: Registration confirmation with employee summary and reporting chain
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import json
+from datetime import datetime, timezone
+from time import time as _time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+# Required Person fields, checked on every registration. The tuple
+# keeps the reporting order; the frozenset serves the presence check
+_REQUIRED_FIELDS = ("name", "employee_id", "email", "department", "position")
+_REQUIRED_SET = frozenset(_REQUIRED_FIELDS)
+
+# Prebuilt error payloads, shallow-copied per return so callers can
+# annotate their response without mutating the module constants
+_MISSING_EMPLOYEE_ERR = {
+    "status": "error",
+    "error": "Missing employee data",
+    "code": "INVALID_REQUEST",
+    "details": "Employee information is required for registration"
+}
+_VALIDATION_ERR_BASE = {
+    "status": "error",
+    "error": "Validation failed",
+    "code": "INVALID_REQUEST"
+}
+_NO_MANAGER_NOTE = "No manager assigned - this may be a top-level executive"
+
+# Every reporting-chain entry is rendered through this one template and
+# joined with this one separator, so the "Name (id) → ..." shape is
+# defined in exactly one place
+_CHAIN_FMT = "%s (%s)"
+_ARROW = " → "
+
+# The timestamps have one-second resolution, so datetime construction
+# and strftime only need to run when the clock ticks into a new second;
+# every other call in that second reuses the rendered strings
+_stamp_cache = (None, "", "")
+
+
+def _utc_stamps():
+    """Return (registration timestamp, date) strings for the current UTC second."""
+    global _stamp_cache
+    sec = int(_time())
+    cached_sec, stamp, today = _stamp_cache
+    if sec != cached_sec:
+        now = datetime.fromtimestamp(sec, timezone.utc)
+        stamp = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+        today = stamp[:10]
+        _stamp_cache = (sec, stamp, today)
+    return stamp, today
+
+# Clean reporting chains keyed by the direct manager's employee_id:
+# everyone under the same manager shares the tail of the chain, so a
+# second registration into the same team skips the whole traversal.
+# Assumes manager data is consistent across payloads for a given id,
+# which holds for org charts. Only warning-free traversals are cached.
+_chain_cache: dict = {}
+_CHAIN_CACHE_MAX = 1024
 
 
 def register_employee(registration_data: dict) -> dict:
@@ -48,226 +106,195 @@ def register_employee(registration_data: dict) -> dict:
         dict: Registration confirmation with status, employee summary, manager info,
               reporting chain, hierarchy levels, and registration timestamp.
     """
-    result = {}
-
     # Extract employee data
     employee = registration_data.get("employee", {})
 
     if not employee:
+        return dict(_MISSING_EMPLOYEE_ERR)
+
+    # Validate required fields. The frozenset difference against the
+    # dict's key view is one C-level set operation; the truthiness scan
+    # only runs once every key is known to be present, and the ordered
+    # missing list is built on the error path alone. Past this point the
+    # required fields are guaranteed present and truthy, so the rest of
+    # the function subscripts them directly instead of paying .get()
+    if (_REQUIRED_SET - employee.keys()
+            or not all(employee[field] for field in _REQUIRED_FIELDS)):
+        missing_fields = [
+            field for field in _REQUIRED_FIELDS if not employee.get(field)]
         return {
-            "status": "error",
-            "error": "Missing employee data",
-            "code": "INVALID_REQUEST",
-            "details": "Employee information is required for registration"
-        }
-
-    # Validate required fields
-    required_fields = ["name", "employee_id",
-                       "email", "department", "position"]
-    missing_fields = [
-        field for field in required_fields if not employee.get(field)]
-
-    if missing_fields:
-        return {
-            "status": "error",
-            "error": "Validation failed",
-            "code": "INVALID_REQUEST",
+            **_VALIDATION_ERR_BASE,
             "details": f"Required fields missing: {', '.join(missing_fields)}"
         }
 
-    # Extract employee information
-    result["status"] = "success"
-    result["message"] = "Employee registered successfully"
-
-    # Employee summary
-    result["employee"] = {
-        "name": employee.get("name"),
-        "employee_id": employee.get("employee_id"),
-        "department": employee.get("department"),
-        "position": employee.get("position"),
-        "start_date": employee.get("start_date", datetime.now().strftime("%Y-%m-%d"))
-    }
+    # One bucketed clock read services the start_date default and the
+    # registration timestamp
+    reg_timestamp, today = _utc_stamps()
 
-    # Build reporting chain
-    reporting_chain = []
-    hierarchy_levels = 1
-    current = employee
-    visited_ids = set()
-
-    # Add employee to chain
-    reporting_chain.append(
-        f"{current.get('name')} ({current.get('employee_id')})")
-    visited_ids.add(current.get('employee_id'))
-
-    # Traverse manager hierarchy
-    while current.get("manager"):
-        current = current.get("manager")
-        manager_id = current.get("employee_id")
-
-        # Check for circular reference (shouldn't happen in real data)
-        if manager_id in visited_ids:
-            result["warning"] = "Circular reference detected in management chain"
-            break
-
-        reporting_chain.append(
-            f"{current.get('name')} ({current.get('employee_id')})")
-        visited_ids.add(manager_id)
-        hierarchy_levels += 1
-
-        # Limit depth to prevent infinite loops
-        if hierarchy_levels > 10:
-            result["warning"] = "Management hierarchy exceeds maximum depth of 10 levels"
-            break
-
-    # Manager information (direct manager only)
     manager = employee.get("manager")
-    if manager:
-        result["manager"] = {
-            "name": manager.get("name"),
-            "employee_id": manager.get("employee_id"),
-            "position": manager.get("position", "Manager")
+
+    # Fast path: without a manager the chain is just the employee, so the
+    # preallocated chain list, visited scan, and join are all skipped
+    if not manager:
+        return {
+            "status": "success",
+            "message": "Employee registered successfully",
+            "employee": {
+                "name": employee["name"],
+                "employee_id": employee["employee_id"],
+                "department": employee["department"],
+                "position": employee["position"],
+                "start_date": employee.get("start_date", today)
+            },
+            "manager": None,
+            "reporting_chain": (
+                _CHAIN_FMT % (employee["name"], employee["employee_id"])),
+            "registration_date": reg_timestamp,
+            "note": _NO_MANAGER_NOTE
         }
+
+    employee_id = employee["employee_id"]
+    employee_entry = _CHAIN_FMT % (employee["name"], employee_id)
+    direct_manager_id = manager.get("employee_id")
+    warning = None
+
+    # One-level path: a manager with no manager of their own is the most
+    # common org shape. The chain is exactly two entries, so the loop,
+    # visited list, and cache traffic are all skipped. The id inequality
+    # guard leaves self-managed (circular) payloads to the general path.
+    if not manager.get("manager") and direct_manager_id != employee_id:
+        hierarchy_levels = 2
+        chain = (employee_entry + _ARROW +
+                 _CHAIN_FMT % (manager.get("name"), direct_manager_id))
     else:
-        result["manager"] = None
-        result["note"] = "No manager assigned - this may be a top-level executive"
+        # Chain cache candidate: the formatted tail is only reused after
+        # confirming the submitted chain matches it id-for-id and ends
+        # where the tail ends. A hit must never skip validating the
+        # payload in hand — a deeper circular reference would otherwise
+        # be reported clean. The confirmation walk is .get() calls only;
+        # the saving is the per-level formatting and list bookkeeping.
+        cached = (_chain_cache.get(direct_manager_id)
+                  if direct_manager_id else None)
+        use_cached = False
+        if cached is not None and employee_id not in cached[1]:
+            node = manager
+            for expected_id in cached[1]:
+                if not node or node.get("employee_id") != expected_id:
+                    break
+                node = node.get("manager")
+            else:
+                use_cached = not node
+        if use_cached:
+            tail_entries = cached[0]
+            hierarchy_levels = 1 + len(tail_entries)
+            chain = _ARROW.join((employee_entry,) + tail_entries)
+        else:
+            # Build reporting chain. The 10-level cap bounds it at 11
+            # entries, so the list is preallocated once and filled by
+            # index — no amortized append growth
+            reporting_chain = [None] * 11
+            reporting_chain[0] = employee_entry
+            hierarchy_levels = 1
+            # The hierarchy is capped at 10 levels, so a linear scan
+            # over a tiny list beats set hashing: no set allocation, no
+            # per-add hash
+            visited_ids = [employee_id]
+
+            # Traverse manager hierarchy: fetch each level once into a
+            # local instead of re-reading "manager" in the loop test and
+            # the body
+            current = manager
+            while current:
+                manager_id = current.get("employee_id")
+
+                # Check for circular reference (shouldn't happen in
+                # real data)
+                if manager_id in visited_ids:
+                    warning = "Circular reference detected in management chain"
+                    break
+
+                reporting_chain[hierarchy_levels] = (
+                    _CHAIN_FMT % (current.get("name"), manager_id))
+                visited_ids.append(manager_id)
+                hierarchy_levels += 1
+
+                # Limit depth to prevent infinite loops
+                if hierarchy_levels > 10:
+                    warning = "Management hierarchy exceeds maximum depth of 10 levels"
+                    break
+
+                current = current.get("manager")
+
+            chain = _ARROW.join(reporting_chain[:hierarchy_levels])
+
+            # Remember the clean tail (manager entries only). A clean
+            # traversal has at most 10 levels, so reusing it can never
+            # push a later registration past the depth cap.
+            if warning is None and direct_manager_id:
+                if len(_chain_cache) >= _CHAIN_CACHE_MAX:
+                    _chain_cache.clear()
+                _chain_cache[direct_manager_id] = (
+                    tuple(reporting_chain[1:hierarchy_levels]),
+                    tuple(visited_ids[1:]))
+
+    # Manager information (direct manager only); the fast path above
+    # guarantees manager is truthy here
+    manager_summary = {
+        "name": manager.get("name"),
+        "employee_id": manager.get("employee_id"),
+        "position": manager.get("position", "Manager")
+    }
 
-    # Reporting chain
-    result["reporting_chain"] = " → ".join(reporting_chain)
+    # Assemble the confirmation in one dict literal so CPython allocates
+    # it at final size with a single BUILD_MAP instead of growing it one
+    # item-assignment at a time
+    result = {
+        "status": "success",
+        "message": "Employee registered successfully",
+        "employee": {
+            "name": employee["name"],
+            "employee_id": employee["employee_id"],
+            "department": employee["department"],
+            "position": employee["position"],
+            "start_date": employee.get("start_date", today)
+        },
+        "manager": manager_summary,
+        "reporting_chain": chain,
+        "registration_date": reg_timestamp
+    }
 
+    # Optional keys only appear when they carry information
+    if warning is not None:
+        result["warning"] = warning
     if hierarchy_levels > 1:
         result["hierarchy_levels"] = hierarchy_levels
 
-    # Registration timestamp
-    result["registration_date"] = datetime.now().isoformat() + "Z"
-
     return result
 
 
-if __name__ == '__main__':
-    # Demo 1: Register employee with manager
-    print("="*70)
-    print("Demo 1: Register Employee with Manager")
-    print("="*70)
+def register_employee_json(registration_data: dict) -> bytes:
+    """Register an employee and return the confirmation as JSON bytes.
 
-    registration_data_1 = {
-        "employee": {
-            "name": "Sarah Martinez",
-            "employee_id": "EMP-201",
-            "email": "sarah.martinez@company.com",
-            "phone": "+1-555-0201",
-            "department": "Engineering",
-            "position": "Software Engineer",
-            "start_date": "2024-02-01",
-            "manager": {
-                "name": "Michael Chen",
-                "employee_id": "EMP-150",
-                "email": "michael.chen@company.com",
-                "phone": "+1-555-0150",
-                "department": "Engineering",
-                "position": "Engineering Manager",
-                "start_date": "2022-05-15"
-            }
-        }
-    }
+    API callers that only forward the confirmation over the wire can use
+    this to serialize straight to bytes (orjson when available, stdlib
+    json otherwise) instead of round-tripping dict -> json.dumps ->
+    encode themselves.
 
-    result = register_employee(registration_data_1)
-    print(f"\nStatus: {result['status']}")
-    print(f"Message: {result['message']}")
-    print(f"\nEmployee:")
-    print(f"  Name: {result['employee']['name']}")
-    print(f"  ID: {result['employee']['employee_id']}")
-    print(f"  Department: {result['employee']['department']}")
-    print(f"  Position: {result['employee']['position']}")
-    print(f"  Start Date: {result['employee']['start_date']}")
-    print(f"\nManager:")
-    if result['manager']:
-        print(f"  Name: {result['manager']['name']}")
-        print(f"  ID: {result['manager']['employee_id']}")
-        print(f"  Position: {result['manager']['position']}")
-    print(f"\nReporting Chain: {result['reporting_chain']}")
-    print(f"Registration Date: {result['registration_date']}")
-
-    # Demo 2: Register senior employee with multi-level hierarchy
-    print("\n" + "="*70)
-    print("Demo 2: Register Senior Employee with Multi-Level Hierarchy")
-    print("="*70)
-
-    registration_data_2 = {
-        "employee": {
-            "name": "James Wilson",
-            "employee_id": "EMP-202",
-            "email": "james.wilson@company.com",
-            "phone": "+1-555-0202",
-            "department": "Product",
-            "position": "Senior Product Manager",
-            "start_date": "2024-03-01",
-            "manager": {
-                "name": "Lisa Anderson",
-                "employee_id": "EMP-100",
-                "email": "lisa.anderson@company.com",
-                "phone": "+1-555-0100",
-                "department": "Product",
-                "position": "VP of Product",
-                "start_date": "2020-01-10",
-                "manager": {
-                    "name": "Robert Taylor",
-                    "employee_id": "EMP-001",
-                    "email": "robert.taylor@company.com",
-                    "phone": "+1-555-0001",
-                    "department": "Executive",
-                    "position": "Chief Product Officer",
-                    "start_date": "2018-06-01"
-                }
-            }
-        }
-    }
+    Args:
+        registration_data (dict): Same payload register_employee accepts.
+
+    Returns:
+        bytes: UTF-8 encoded JSON confirmation or error.
+    """
+    result = register_employee(registration_data)
+    if orjson is not None:
+        return orjson.dumps(result)
+    return json.dumps(result).encode()
 
-    result = register_employee(registration_data_2)
-    print(f"\nStatus: {result['status']}")
-    print(f"Message: {result['message']}")
-    print(f"\nEmployee:")
-    print(f"  Name: {result['employee']['name']}")
-    print(f"  ID: {result['employee']['employee_id']}")
-    print(f"  Department: {result['employee']['department']}")
-    print(f"  Position: {result['employee']['position']}")
-    print(f"\nManager:")
-    if result['manager']:
-        print(f"  Name: {result['manager']['name']}")
-        print(f"  ID: {result['manager']['employee_id']}")
-        print(f"  Position: {result['manager']['position']}")
-    print(f"\nReporting Chain: {result['reporting_chain']}")
-    print(f"Hierarchy Levels: {result.get('hierarchy_levels', 1)}")
-    print(f"Registration Date: {result['registration_date']}")
-
-    # Demo 3: Register top-level executive (no manager)
-    print("\n" + "="*70)
-    print("Demo 3: Register Top-Level Executive (No Manager)")
-    print("="*70)
-
-    registration_data_3 = {
-        "employee": {
-            "name": "Jennifer Lee",
-            "employee_id": "EMP-001",
-            "email": "jennifer.lee@company.com",
-            "phone": "+1-555-0001",
-            "department": "Executive",
-            "position": "Chief Executive Officer",
-            "start_date": "2015-01-01"
-        }
-    }
 
-    result = register_employee(registration_data_3)
-    print(f"\nStatus: {result['status']}")
-    print(f"Message: {result['message']}")
-    print(f"\nEmployee:")
-    print(f"  Name: {result['employee']['name']}")
-    print(f"  ID: {result['employee']['employee_id']}")
-    print(f"  Department: {result['employee']['department']}")
-    print(f"  Position: {result['employee']['position']}")
-    print(f"\nManager: {result['manager']}")
-    if 'note' in result:
-        print(f"Note: {result['note']}")
-    print(f"\nReporting Chain: {result['reporting_chain']}")
-    print(f"Registration Date: {result['registration_date']}")
+if __name__ == '__main__':
+    # Demos live in their own module so importing this one stays cheap
+    import _register_employee_demo
+    _register_employee_demo.run()
 
 # Made with Bob - Real-world employee registration tool with circular schema references